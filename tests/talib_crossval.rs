@@ -241,14 +241,37 @@ fn run_python_enhanced_export() -> Option<Value> {
 // Helpers: deserialize bars, compare results
 // ============================================================
 
-fn json_bars_to_test_bars(bars_json: &[Value]) -> Vec<TestBar> {
-    bars_json
-        .iter()
-        .map(|b| TestBar {
-            o: b["o"].as_f64().unwrap(),
-            h: b["h"].as_f64().unwrap(),
-            l: b["l"].as_f64().unwrap(),
-            c: b["c"].as_f64().unwrap(),
+/// Bars are exported column-wise: `{"o": [...], "h": [...], "l": [...], "c": [...]}`.
+fn json_bars_to_test_bars(bars_json: &Value) -> Vec<TestBar> {
+    let column = |key: &str| -> Vec<f64> {
+        bars_json[key]
+            .as_array()
+            .unwrap_or_else(|| panic!("missing bars column '{key}'"))
+            .iter()
+            // JSON has no NaN: a missing price arrives as null.
+            .map(|v| match v {
+                Value::Null => f64::NAN,
+                _ => v
+                    .as_f64()
+                    .unwrap_or_else(|| panic!("non-numeric value in bars column '{key}': {v}")),
+            })
+            .collect()
+    };
+    let (o, h, l, c) = (column("o"), column("h"), column("l"), column("c"));
+    for (key, len) in [("o", o.len()), ("h", h.len()), ("l", l.len())] {
+        assert_eq!(
+            len,
+            c.len(),
+            "bars column '{key}' has {len} values but 'c' has {}",
+            c.len()
+        );
+    }
+    (0..c.len())
+        .map(|i| TestBar {
+            o: o[i],
+            h: h[i],
+            l: l[i],
+            c: c[i],
         })
         .collect()
 }
@@ -453,10 +476,9 @@ fn talib_crossval_all_61_patterns() {
     for (talib_name, case) in test_cases.as_object().unwrap() {
         total_patterns += 1;
 
-        let bars_json = case["bars"].as_array().expect("missing 'bars'");
         let result_json = case["result"].as_array().expect("missing 'result'");
 
-        let bars = json_bars_to_test_bars(bars_json);
+        let bars = json_bars_to_test_bars(&case["bars"]);
         let mismatches = compare_pattern(talib_name, result_json, &bars, &engine);
 
         if mismatches.is_empty() {
@@ -514,10 +536,7 @@ fn talib_crossval_fuzz() {
         let seed = round["seed"].as_u64().unwrap_or(0);
         total_rounds += 1;
 
-        let bars_json = round["bars"]
-            .as_array()
-            .expect("missing 'bars' in fuzz round");
-        let bars = json_bars_to_test_bars(bars_json);
+        let bars = json_bars_to_test_bars(&round["bars"]);
 
         let results = round["results"].as_object().expect("missing 'results'");
 
@@ -593,10 +612,7 @@ fn talib_crossval_enhanced_fuzz() {
         let base = round["base"].as_f64().unwrap_or(0.0);
         total_rounds += 1;
 
-        let bars_json = round["bars"]
-            .as_array()
-            .expect("missing 'bars' in enhanced fuzz round");
-        let bars = json_bars_to_test_bars(bars_json);
+        let bars = json_bars_to_test_bars(&round["bars"]);
 
         let results = round["results"]
             .as_object()
@@ -672,10 +688,7 @@ fn talib_crossval_edge_cases() {
     for (case_name, case_data) in edge_cases {
         total_scenarios += 1;
 
-        let bars_json = case_data["bars"]
-            .as_array()
-            .expect("missing 'bars' in edge case");
-        let bars = json_bars_to_test_bars(bars_json);
+        let bars = json_bars_to_test_bars(&case_data["bars"]);
         let results = case_data["results"]
             .as_object()
             .expect("missing 'results' in edge case");
@@ -753,10 +766,7 @@ fn talib_crossval_real_data() {
     for (ticker, ticker_data) in real_data {
         total_tickers += 1;
 
-        let bars_json = ticker_data["bars"]
-            .as_array()
-            .expect("missing 'bars' in real data");
-        let bars = json_bars_to_test_bars(bars_json);
+        let bars = json_bars_to_test_bars(&ticker_data["bars"]);
         let bar_count = bars.len();
         eprintln!("[{ticker}] Testing {bar_count} bars...");
 
@@ -12,6 +12,7 @@ Features:
 
 Requirements:
     pip install TA-Lib numpy pandas yfinance
+    pip install orjson    # optional, speeds up the JSON exports
 
 Usage:
     python tests/talib_validation.py              # Run all tests
@@ -23,11 +24,13 @@ Usage:
 """
 
 import json
-import random
+import os
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Any, Callable, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Tuple, Any, Callable, Optional, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -39,6 +42,24 @@ except ImportError:
     print("On macOS: brew install ta-lib")
     exit(1)
 
+try:
+    import orjson  # optional: much faster JSON export, serializes ndarrays natively
+except ImportError:
+    orjson = None
+
+
+def _init_talib_settings() -> None:
+    """Pin TA-Lib's global settings to their defaults.
+
+    The suite assumes these stay fixed for the whole run; nothing below
+    changes them. Also used as the worker initializer for fuzz pools.
+    """
+    talib.set_compatibility(0)
+    talib.set_unstable_period("ALL", 0)
+
+
+_init_talib_settings()
+
 
 # All 61 TA-Lib CDL functions for cross-validation
 TALIB_FUNCS = {
@@ -105,1016 +126,852 @@ TALIB_FUNCS = {
     "CDLXSIDEGAP3METHODS": talib.CDLXSIDEGAP3METHODS,
 }
 
+# Frozen at import so hot loops iterate tuples instead of the dict
+_FUNC_NAMES: Tuple[str, ...] = tuple(TALIB_FUNCS)
+_FUNC_CALLS: Tuple[Callable[..., np.ndarray], ...] = tuple(TALIB_FUNCS.values())
+
+
+# TA-Lib's Python wrapper only accepts double inputs ("input array type is not
+# double"), so fixtures stay float64 even where float32 would keep every ratio.
+PRICE_DTYPE = np.float64
+
+
+def bars_array(n: int) -> np.ndarray:
+    """Allocate a (4, n) float64 OHLC buffer. Rows: open, high, low, close.
+
+    Each row is contiguous, so unpacking the buffer (``o, h, l, c = bars``)
+    yields views that can be handed to TA-Lib without a copy.
+    """
+    return np.empty((4, n), dtype=PRICE_DTYPE)
+
+
+# OHLC buffer reused by every curated case; all series fit in 64 bars.
+_scratch = bars_array(64)
+
+
+def _scratch_bars(n: int) -> np.ndarray:
+    """Return a (4, n) view of the scratch buffer, growing it if needed.
+
+    Rows of the view stay contiguous, so they still reach TA-Lib without a copy.
+    """
+    global _scratch
+    if _scratch.shape[1] < n:
+        _scratch = bars_array(n)
+    return _scratch[:, :n]
+
+
+def _talib_ready(*arrays: np.ndarray) -> bool:
+    """True if TA-Lib reads every array in place (C-contiguous PRICE_DTYPE) rather than copying it."""
+    return all(a.dtype == PRICE_DTYPE and a.flags.c_contiguous for a in arrays)
+
+
+def _bars_json(o: np.ndarray, h: np.ndarray, l: np.ndarray, c: np.ndarray) -> Dict[str, np.ndarray]:
+    """Columnar bars object, as the Rust cross-validation reads it.
+
+    The arrays are kept as-is; dump_json() serializes them without building
+    Python float lists, so callers must not overwrite them afterwards.
+    """
+    return {"o": o, "h": h, "l": l, "c": c}
+
 
-@dataclass
-class Bar:
-    """OHLCV bar data."""
-    open: float
-    high: float
-    low: float
-    close: float
-    volume: float = 1000.0
+def _json_default(obj: Any) -> Any:
+    """json fallback for values orjson would serialize natively."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
-def bars_to_arrays(bars: List[Bar]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
-    """Convert list of bars to numpy arrays for TA-Lib."""
-    opens = np.array([b.open for b in bars], dtype=np.float64)
-    highs = np.array([b.high for b in bars], dtype=np.float64)
-    lows = np.array([b.low for b in bars], dtype=np.float64)
-    closes = np.array([b.close for b in bars], dtype=np.float64)
-    return opens, highs, lows, closes
+def dump_json(obj: Any, fp) -> None:
+    """Write obj as compact JSON to the text stream fp, ndarrays included.
+
+    With orjson the encoded bytes go straight to fp's binary buffer (e.g.
+    sys.stdout.buffer) when it has one, skipping a decode/re-encode pass.
+    Exported floats must be finite: orjson would write NaN as null, and the
+    json fallback refuses it rather than emit a non-standard NaN token.
+    """
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+        buffer = getattr(fp, "buffer", None)
+        if buffer is None:
+            fp.write(data.decode())
+        else:
+            fp.flush()
+            buffer.write(data)
+            buffer.flush()
+    else:
+        json.dump(obj, fp, separators=(",", ":"), default=_json_default, allow_nan=False)
 
 
 # ============================================================
 # TEST DATA GENERATORS
 # ============================================================
 
-def make_downtrend(n: int = 10, start: float = 100.0, step: float = 3.0) -> List[Bar]:
-    """Generate a downtrend series of bars."""
-    bars = []
-    for i in range(n):
-        base = start - i * step
-        bars.append(Bar(
-            open=base + 2,
-            high=base + 3,
-            low=base - 1,
-            close=base - 0.5
-        ))
-    return bars
+# Root of all fixture randomness. Stream i is the i-th child of this sequence, so
+# every fuzz index gets an independent, reproducible generator in any process.
+_SEED_ROOT = np.random.SeedSequence(20240101)
+
+
+def make_rng(stream: int) -> np.random.Generator:
+    """Return the generator for fixture stream `stream` (same as _SEED_ROOT.spawn()[stream])."""
+    return np.random.default_rng(np.random.SeedSequence(_SEED_ROOT.entropy, spawn_key=(stream,)))
 
 
-def make_uptrend(n: int = 10, start: float = 100.0, step: float = 3.0) -> List[Bar]:
-    """Generate an uptrend series of bars."""
-    bars = []
-    for i in range(n):
-        base = start + i * step
-        bars.append(Bar(
-            open=base - 1,
-            high=base + 2,
-            low=base - 2,
-            close=base + 1
-        ))
+# Per-row (open, high, low, close) offsets from the trend line, shaped (4, 1) so
+# each generator fills its whole buffer in a single broadcast.
+_DOWNTREND_OFFSETS = np.array([[2.0], [3.0], [-1.0], [-0.5]], dtype=PRICE_DTYPE)
+_UPTREND_OFFSETS = np.array([[-1.0], [2.0], [-2.0], [1.0]], dtype=PRICE_DTYPE)
+_SIDEWAYS_OFFSETS = np.array([[-2.0], [4.0], [-4.0], [2.0]], dtype=PRICE_DTYPE)
+
+
+def make_downtrend(n: int = 10, start: float = 100.0, step: float = 3.0) -> np.ndarray:
+    """Generate a downtrend series as a (4, n) OHLC buffer."""
+    base = start - np.arange(n, dtype=PRICE_DTYPE) * step
+    return np.add(base, _DOWNTREND_OFFSETS, out=bars_array(n))
+
+
+def make_uptrend(n: int = 10, start: float = 100.0, step: float = 3.0) -> np.ndarray:
+    """Generate an uptrend series as a (4, n) OHLC buffer."""
+    base = start + np.arange(n, dtype=PRICE_DTYPE) * step
+    return np.add(base, _UPTREND_OFFSETS, out=bars_array(n))
+
+
+def make_sideways(n: int = 10, base: float = 100.0) -> np.ndarray:
+    """Generate a sideways/flat series as a (4, n) OHLC buffer."""
+    bars = bars_array(n)
+    bars[:] = base + _SIDEWAYS_OFFSETS
     return bars
 
 
-def make_sideways(n: int = 10, base: float = 100.0) -> List[Bar]:
-    """Generate a sideways/flat series of bars."""
-    bars = []
-    for i in range(n):
-        bars.append(Bar(
-            open=base - 2,
-            high=base + 4,
-            low=base - 4,
-            close=base + 2
-        ))
+# Trend prefixes shared by the curated pattern tests. Built once at import and
+# read-only; tests copy them into the leading columns of their own buffer.
+UP10 = make_uptrend(10)
+UP15 = make_uptrend(15)
+DOWN10 = make_downtrend(10)
+DOWN15 = make_downtrend(15)
+SIDE10 = make_sideways(10)
+# Flat lead-in followed by a five-bar advance (the CDL3BLACKCROWS setup).
+FLAT10_RISE5 = bars_array(15)
+FLAT10_RISE5[:, :10] = [[100.0], [105.0], [95.0], [102.0]]
+_rise = np.arange(5) * 8
+FLAT10_RISE5[:, 10:] = 102 + _rise, 108 + _rise, 100 + _rise, 105 + _rise
+for _prefix in (UP10, UP15, DOWN10, DOWN15, SIDE10, FLAT10_RISE5):
+    _prefix.setflags(write=False)
+del _prefix, _rise
+
+
+def make_random_bars(n: int = 50, base: float = 100.0, volatility: float = 5.0,
+                     rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """Generate a random walk as a (4, n) OHLC buffer."""
+    if rng is None:
+        rng = np.random.default_rng()
+    changes = rng.uniform(-volatility, volatility, n)
+    hi_pad = rng.uniform(0, volatility * 0.5, n)
+    lo_pad = rng.uniform(0, volatility * 0.5, n)
+
+    bars = bars_array(n)
+    bars[3] = base + np.cumsum(changes)
+    bars[0, 0] = base
+    bars[0, 1:] = bars[3, :-1]
+    bars[1] = np.maximum(bars[0], bars[3]) + hi_pad
+    bars[2] = np.minimum(bars[0], bars[3]) - lo_pad
     return bars
 
 
-def make_random_bars(n: int = 50, base: float = 100.0, volatility: float = 5.0) -> List[Bar]:
-    """Generate random OHLCV bars."""
-    bars = []
-    price = base
-    for _ in range(n):
-        change = random.uniform(-volatility, volatility)
-        o = price
-        c = price + change
-        h = max(o, c) + random.uniform(0, volatility * 0.5)
-        l = min(o, c) - random.uniform(0, volatility * 0.5)
-        bars.append(Bar(open=o, high=h, low=l, close=c))
-        price = c
+def make_random_bars_batch(n: int, bases: Sequence[float], vols: Sequence[float],
+                           rngs: Sequence[np.random.Generator]) -> np.ndarray:
+    """Stack one make_random_bars() walk per generator into a (rounds, 4, n) buffer.
+
+    Round i only depends on ``rngs[i]``, ``bases[i]`` and ``vols[i]``, so any
+    round can be rebuilt on its own. Every round is a contiguous (4, n) buffer.
+    """
+    if not len(rngs) == len(bases) == len(vols):
+        raise ValueError(f"need one base and volatility per generator, got "
+                         f"{len(rngs)} generators, {len(bases)} bases, {len(vols)} volatilities")
+    bars = np.empty((len(rngs), 4, n), dtype=PRICE_DTYPE)
+    for i, (rng, base, vol) in enumerate(zip(rngs, bases, vols)):
+        bars[i] = make_random_bars(n, base, vol, rng)
     return bars
 
 
-def make_zero_range_bars(n=50):
+def make_zero_range_bars(n: int = 50, rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """Bars where O=H=L=C (perfect doji/flat). Tests zero-division edge cases."""
-    bars = []
-    price = 100.0
-    for _ in range(n):
-        price += random.uniform(-0.5, 0.5)
-        bars.append(Bar(open=price, high=price, low=price, close=price))
+    if rng is None:
+        rng = np.random.default_rng()
+    price = 100.0 + np.cumsum(rng.uniform(-0.5, 0.5, n))
+    bars = bars_array(n)
+    bars[:] = price
     return bars
 
 
-def make_gap_bars(n=50):
+def make_gap_bars(n: int = 50, rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """Bars with large gaps between consecutive bars. Tests gap-dependent patterns."""
-    bars = []
-    price = 100.0
-    for _ in range(n):
-        gap = random.uniform(0.05, 0.15) * price * random.choice([-1, 1])
-        o = price + gap
-        change = random.uniform(-2.0, 2.0)
-        c = o + change
-        h = max(o, c) + random.uniform(0, 1.0)
-        l = min(o, c) - random.uniform(0, 1.0)
-        bars.append(Bar(open=o, high=h, low=l, close=c))
-        price = c
+    if rng is None:
+        rng = np.random.default_rng()
+    gaps = rng.uniform(0.05, 0.15, n) * rng.choice([-1, 1], size=n)
+    changes = rng.uniform(-2.0, 2.0, n)
+    hi_pad = rng.uniform(0, 1.0, n)
+    lo_pad = rng.uniform(0, 1.0, n)
+
+    # Each open gaps away from the previous close: close[i] = close[i-1] * (1 + gap[i])
+    # + change[i]. Solve the linear recurrence with a cumulative product and sum.
+    growth = np.cumprod(1.0 + gaps)
+    closes = growth * (100.0 + np.cumsum(changes / growth))
+
+    bars = bars_array(n)
+    bars[0] = closes - changes
+    bars[3] = closes
+    bars[1] = np.maximum(bars[0], bars[3]) + hi_pad
+    bars[2] = np.minimum(bars[0], bars[3]) - lo_pad
     return bars
 
 
-def make_extreme_high_bars(n=50):
+def make_extreme_high_bars(n: int = 50, rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """Bars at very high prices (~1e6). Tests numerical stability."""
-    return make_random_bars(n, base=1_000_000, volatility=50_000)
+    return make_random_bars(n, base=1_000_000, volatility=50_000, rng=rng)
 
 
-def make_extreme_low_bars(n=50):
+def make_extreme_low_bars(n: int = 50, rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """Bars at penny-stock prices (~0.01). Tests small number handling."""
-    return make_random_bars(n, base=0.05, volatility=0.005)
+    return make_random_bars(n, base=0.05, volatility=0.005, rng=rng)
 
 
-def make_micro_volatility_bars(n=50):
+def make_micro_volatility_bars(n: int = 50, rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """Bars with nearly zero body/shadow. Tests threshold edge cases."""
-    return make_random_bars(n, base=100, volatility=0.01)
+    return make_random_bars(n, base=100, volatility=0.01, rng=rng)
 
 
-# ============================================================
-# ALL 61 TA-LIB PATTERN TEST GENERATORS
-# ============================================================
-
-def test_cdl2crows() -> Dict[str, Any]:
-    """CDL2CROWS - Two Crows"""
-    bars = make_uptrend(10)
-    # Long white candle
-    bars.append(Bar(open=128, high=135, low=127, close=134))
-    # First crow: gaps up, closes lower but above first body
-    bars.append(Bar(open=136, high=137, low=132, close=133))
-    # Second crow: opens inside first crow, closes inside first white body
-    bars.append(Bar(open=134, high=135, low=129, close=130))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDL2CROWS(o, h, l, c)
-    return {"pattern": "CDL2CROWS", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdl3blackcrows() -> Dict[str, Any]:
-    """CDL3BLACKCROWS - Three Black Crows"""
-    bars = []
-    for _ in range(10):
-        bars.append(Bar(open=100.0, high=105.0, low=95.0, close=102.0))
-    for i in range(5):
-        bars.append(Bar(open=102 + i * 8, high=105 + i * 8 + 3, low=100 + i * 8, close=105 + i * 8))
-    bars.append(Bar(open=135.0, high=137.0, low=125.0, close=125.0))
-    bars.append(Bar(open=127.0, high=128.0, low=115.0, close=115.0))
-    bars.append(Bar(open=118.0, high=119.0, low=105.0, close=105.0))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDL3BLACKCROWS(o, h, l, c)
-    return {"pattern": "CDL3BLACKCROWS", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdl3inside() -> Dict[str, Any]:
-    """CDL3INSIDE - Three Inside Up/Down"""
-    bars = make_downtrend(10)
-    # Large bearish
-    bars.append(Bar(open=72, high=73, low=66, close=67))
-    # Small bullish inside
-    bars.append(Bar(open=68, high=70, low=67.5, close=69.5))
-    # Bullish confirmation closing above first
-    bars.append(Bar(open=69, high=74, low=68.5, close=73))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDL3INSIDE(o, h, l, c)
-    return {"pattern": "CDL3INSIDE", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdl3linestrike() -> Dict[str, Any]:
-    """CDL3LINESTRIKE - Three-Line Strike"""
-    bars = make_downtrend(10)
-    # Three bearish candles
-    bars.append(Bar(open=72, high=73, low=68, close=69))
-    bars.append(Bar(open=69, high=70, low=65, close=66))
-    bars.append(Bar(open=66, high=67, low=62, close=63))
-    # Bullish engulfing all three
-    bars.append(Bar(open=62, high=74, low=61, close=73))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDL3LINESTRIKE(o, h, l, c)
-    return {"pattern": "CDL3LINESTRIKE", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdl3outside() -> Dict[str, Any]:
-    """CDL3OUTSIDE - Three Outside Up/Down"""
-    bars = make_downtrend(10)
-    # Small bearish
-    bars.append(Bar(open=72, high=73, low=70, close=71))
-    # Bullish engulfing
-    bars.append(Bar(open=70, high=75, low=69, close=74))
-    # Bullish confirmation
-    bars.append(Bar(open=74, high=78, low=73, close=77))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDL3OUTSIDE(o, h, l, c)
-    return {"pattern": "CDL3OUTSIDE", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdl3starsinsouth() -> Dict[str, Any]:
-    """CDL3STARSINSOUTH - Three Stars In The South"""
-    bars = make_downtrend(10)
-    # First: long black with long lower shadow
-    bars.append(Bar(open=72, high=73, low=62, close=65))
-    # Second: smaller black, higher low, inside first
-    bars.append(Bar(open=66, high=67, low=63, close=64))
-    # Third: small marubozu near lows
-    bars.append(Bar(open=64, high=65, low=63.5, close=64.5))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDL3STARSINSOUTH(o, h, l, c)
-    return {"pattern": "CDL3STARSINSOUTH", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdl3whitesoldiers() -> Dict[str, Any]:
-    """CDL3WHITESOLDIERS - Three Advancing White Soldiers"""
-    bars = []
-    for i in range(10):
-        base = 100 - i * 3
-        bars.append(Bar(open=base + 2, high=base + 3, low=base - 1, close=base - 0.5))
-    bars.append(Bar(open=70.0, high=75.0, low=69.5, close=74.8))
-    bars.append(Bar(open=73.0, high=79.0, low=72.5, close=78.8))
-    bars.append(Bar(open=77.0, high=83.0, low=76.5, close=82.8))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDL3WHITESOLDIERS(o, h, l, c)
-    return {"pattern": "CDL3WHITESOLDIERS", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlabandonedbaby() -> Dict[str, Any]:
-    """CDLABANDONEDBABY - Abandoned Baby"""
-    bars = make_downtrend(10)
-    # Long bearish
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    # Doji with gap down (abandoned)
-    bars.append(Bar(open=63, high=63.5, low=62.5, close=63))
-    # Long bullish with gap up
-    bars.append(Bar(open=65, high=72, low=64, close=71))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLABANDONEDBABY(o, h, l, c)
-    return {"pattern": "CDLABANDONEDBABY", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdladvanceblock() -> Dict[str, Any]:
-    """CDLADVANCEBLOCK - Advance Block"""
-    bars = make_downtrend(10)
-    # Three white candles with diminishing bodies and increasing upper shadows
-    bars.append(Bar(open=70, high=78, low=69, close=77))
-    bars.append(Bar(open=76, high=82, low=75, close=80))
-    bars.append(Bar(open=79, high=84, low=78, close=81))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLADVANCEBLOCK(o, h, l, c)
-    return {"pattern": "CDLADVANCEBLOCK", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlbelthold() -> Dict[str, Any]:
-    """CDLBELTHOLD - Belt-hold"""
-    bars = make_downtrend(15)
-    # Bullish belt hold: opens at low, closes near high
-    bars.append(Bar(open=55, high=62, low=55, close=61.5))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLBELTHOLD(o, h, l, c)
-    return {"pattern": "CDLBELTHOLD", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlbreakaway() -> Dict[str, Any]:
-    """CDLBREAKAWAY - Breakaway"""
-    bars = make_downtrend(10)
-    # Long black
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    # Gap down black
-    bars.append(Bar(open=64, high=65, low=62, close=63))
-    # Small black
-    bars.append(Bar(open=63, high=64, low=61, close=62))
-    # Small black
-    bars.append(Bar(open=62, high=63, low=60, close=61))
-    # Long white closing the gap
-    bars.append(Bar(open=60, high=70, low=59, close=69))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLBREAKAWAY(o, h, l, c)
-    return {"pattern": "CDLBREAKAWAY", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlclosingmarubozu() -> Dict[str, Any]:
-    """CDLCLOSINGMARUBOZU - Closing Marubozu"""
-    bars = make_sideways(10)
-    # Bullish closing marubozu: close = high
-    bars.append(Bar(open=98, high=108, low=97, close=108))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLCLOSINGMARUBOZU(o, h, l, c)
-    return {"pattern": "CDLCLOSINGMARUBOZU", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlconcealbabyswall() -> Dict[str, Any]:
-    """CDLCONCEALBABYSWALL - Concealing Baby Swallow"""
-    bars = make_downtrend(10)
-    # Two black marubozu
-    bars.append(Bar(open=72, high=72, low=65, close=65))
-    bars.append(Bar(open=65, high=65, low=58, close=58))
-    # Black with upper shadow into previous body
-    bars.append(Bar(open=56, high=60, low=52, close=53))
-    # Black engulfing third
-    bars.append(Bar(open=54, high=57, low=50, close=51))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLCONCEALBABYSWALL(o, h, l, c)
-    return {"pattern": "CDLCONCEALBABYSWALL", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlcounterattack() -> Dict[str, Any]:
-    """CDLCOUNTERATTACK - Counterattack"""
-    bars = make_downtrend(10)
-    # Long black
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    # Long white closing at same level
-    bars.append(Bar(open=60, high=67, low=59, close=66))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLCOUNTERATTACK(o, h, l, c)
-    return {"pattern": "CDLCOUNTERATTACK", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdldarkcloudcover() -> Dict[str, Any]:
-    """CDLDARKCLOUDCOVER - Dark Cloud Cover"""
-    bars = make_uptrend(10)
-    bars.append(Bar(open=118.0, high=122.0, low=117.0, close=121.0))
-    bars.append(Bar(open=123.0, high=124.0, low=118.0, close=119.0))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLDARKCLOUDCOVER(o, h, l, c)
-    return {"pattern": "CDLDARKCLOUDCOVER", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdldoji() -> Dict[str, Any]:
-    """CDLDOJI - Doji"""
-    bars = make_downtrend(10)
-    bars.append(Bar(open=80.0, high=85.0, low=75.0, close=80.0))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLDOJI(o, h, l, c)
-    return {"pattern": "CDLDOJI", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdldojistar() -> Dict[str, Any]:
-    """CDLDOJISTAR - Doji Star"""
-    bars = make_downtrend(10)
-    # Long black
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    # Gap down doji
-    bars.append(Bar(open=63, high=64, low=62, close=63))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLDOJISTAR(o, h, l, c)
-    return {"pattern": "CDLDOJISTAR", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdldragonflydoji() -> Dict[str, Any]:
-    """CDLDRAGONFLYDOJI - Dragonfly Doji"""
-    bars = make_downtrend(10)
-    bars.append(Bar(open=80.0, high=80.0, low=70.0, close=80.0))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLDRAGONFLYDOJI(o, h, l, c)
-    return {"pattern": "CDLDRAGONFLYDOJI", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlengulfing() -> Dict[str, Any]:
-    """CDLENGULFING - Engulfing Pattern"""
-    bars = make_downtrend(10)
-    bars.append(Bar(open=80.0, high=81.0, low=79.0, close=79.5))
-    bars.append(Bar(open=79.0, high=82.0, low=78.0, close=81.5))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLENGULFING(o, h, l, c)
-    return {"pattern": "CDLENGULFING", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
+# Random generators addressable by name, so fixtures can be cached by (name, n, seed)
+FIXTURE_GENERATORS: Dict[str, Callable[..., np.ndarray]] = {
+    "random": make_random_bars,
+    "zero_range": make_zero_range_bars,
+    "gaps": make_gap_bars,
+    "extreme_high": make_extreme_high_bars,
+    "extreme_low": make_extreme_low_bars,
+    "micro_volatility": make_micro_volatility_bars,
+}
+
+
+@lru_cache(maxsize=None)
+def _fixture(name: str, n: int, seed: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Build the O/H/L/C arrays of a named fixture once per process.
+
+    The arrays are shared between callers, so they are made read-only.
+    """
+    bars = FIXTURE_GENERATORS[name](n, rng=make_rng(seed))
+    bars.setflags(write=False)
+    assert _talib_ready(*bars), f"fixture {name!r} is not a contiguous {PRICE_DTYPE.__name__} buffer"
+    return tuple(bars)
+
+
+@lru_cache(maxsize=None)
+def _fixture_json(name: str, n: int, seed: int) -> Dict[str, np.ndarray]:
+    """Columnar bars JSON of a named fixture, built once per process.
+
+    Shared between callers like the arrays themselves; treat it as read-only.
+    """
+    return _bars_json(*_fixture(name, n, seed))
+
+
+# Narrowest dtype that holds every CDL output: {0, +-80, +-100, +-200}
+# (CDLHIKKAKE/CDLHIKKAKEMOD report confirmations as +-200, so int8 is too small).
+RESULT_DTYPE = np.int16
 
 
-def test_cdleveningdojistar() -> Dict[str, Any]:
-    """CDLEVENINGDOJISTAR - Evening Doji Star"""
-    bars = make_uptrend(10)
-    # Long white
-    bars.append(Bar(open=128, high=135, low=127, close=134))
-    # Gap up doji
-    bars.append(Bar(open=137, high=138, low=136, close=137))
-    # Long black
-    bars.append(Bar(open=135, high=136, low=128, close=129))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLEVENINGDOJISTAR(o, h, l, c)
-    return {"pattern": "CDLEVENINGDOJISTAR", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
+# Only patterns that can fire when every bar has O=H=L=C. All other CDL functions
+# need a strictly positive body/shadow or a black candle, so TA-Lib returns zeros.
+# Locked against TA-Lib on zero-range walks (constant, drifting, stepped, jumping).
+ZERO_RANGE_PATTERNS = ("CDLDOJI", "CDLGAPSIDESIDEWHITE", "CDLTRISTAR")
+_ZERO_RANGE_ROWS = tuple(i for i, name in enumerate(_FUNC_NAMES) if name in ZERO_RANGE_PATTERNS)
 
 
-def test_cdleveningstar() -> Dict[str, Any]:
-    """CDLEVENINGSTAR - Evening Star"""
-    bars = make_uptrend(10)
-    bars.append(Bar(open=118.0, high=123.0, low=117.0, close=122.0))
-    bars.append(Bar(open=124.0, high=124.5, low=123.5, close=123.8))
-    bars.append(Bar(open=123.0, high=123.5, low=118.0, close=119.0))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLEVENINGSTAR(o, h, l, c)
-    return {"pattern": "CDLEVENINGSTAR", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlgapsidesidewhite() -> Dict[str, Any]:
-    """CDLGAPSIDESIDEWHITE - Up/Down-gap side-by-side white lines"""
-    bars = make_uptrend(10)
-    # Gap up
-    bars.append(Bar(open=132, high=136, low=131, close=135))
-    # Two similar white candles side by side
-    bars.append(Bar(open=137, high=141, low=136, close=140))
-    bars.append(Bar(open=137, high=141, low=136, close=140))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLGAPSIDESIDEWHITE(o, h, l, c)
-    return {"pattern": "CDLGAPSIDESIDEWHITE", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlgravestonedoji() -> Dict[str, Any]:
-    """CDLGRAVESTONEDOJI - Gravestone Doji"""
-    bars = make_uptrend(10)
-    bars.append(Bar(open=120.0, high=130.0, low=120.0, close=120.0))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLGRAVESTONEDOJI(o, h, l, c)
-    return {"pattern": "CDLGRAVESTONEDOJI", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlhammer() -> Dict[str, Any]:
-    """CDLHAMMER - Hammer"""
-    bars = []
-    for i in range(15):
-        base = 100 - i * 3
-        bars.append(Bar(open=base + 2, high=base + 3, low=base - 1, close=base - 0.5))
-    bars.append(Bar(open=54.0, high=54.5, low=48.0, close=54.5))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLHAMMER(o, h, l, c)
-    return {"pattern": "CDLHAMMER", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlhangingman() -> Dict[str, Any]:
-    """CDLHANGINGMAN - Hanging Man"""
-    bars = []
-    for i in range(15):
-        base = 100 + i * 3
-        bars.append(Bar(open=base - 1, high=base + 2, low=base - 2, close=base + 1))
-    bars.append(Bar(open=145.0, high=145.5, low=139.0, close=145.5))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLHANGINGMAN(o, h, l, c)
-    return {"pattern": "CDLHANGINGMAN", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlharami() -> Dict[str, Any]:
-    """CDLHARAMI - Harami Pattern"""
-    bars = make_downtrend(10)
-    bars.append(Bar(open=82.0, high=83.0, low=78.0, close=79.0))
-    bars.append(Bar(open=79.5, high=80.5, low=79.0, close=80.0))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLHARAMI(o, h, l, c)
-    return {"pattern": "CDLHARAMI", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlharamicross() -> Dict[str, Any]:
-    """CDLHARAMICROSS - Harami Cross Pattern"""
-    bars = make_downtrend(10)
-    # Large bearish
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    # Doji inside
-    bars.append(Bar(open=69, high=70, low=68, close=69))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLHARAMICROSS(o, h, l, c)
-    return {"pattern": "CDLHARAMICROSS", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlhighwave() -> Dict[str, Any]:
-    """CDLHIGHWAVE - High-Wave Candle"""
-    bars = make_sideways(10)
-    # Very long shadows, tiny body
-    bars.append(Bar(open=100, high=115, low=85, close=100.5))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLHIGHWAVE(o, h, l, c)
-    return {"pattern": "CDLHIGHWAVE", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlhikkake() -> Dict[str, Any]:
-    """CDLHIKKAKE - Hikkake Pattern"""
-    bars = make_sideways(10)
-    # Inside bar
-    bars.append(Bar(open=99, high=101, low=99, close=100))
-    bars.append(Bar(open=99.5, high=100.5, low=99.2, close=99.8))
-    # Breakout fails
-    bars.append(Bar(open=99.5, high=99.8, low=98, close=98.5))
-    # Reversal
-    bars.append(Bar(open=98.5, high=102, low=98, close=101.5))
-    bars.append(Bar(open=101, high=103, low=100.5, close=102.5))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLHIKKAKE(o, h, l, c)
-    return {"pattern": "CDLHIKKAKE", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlhikkakemod() -> Dict[str, Any]:
-    """CDLHIKKAKEMOD - Modified Hikkake Pattern"""
-    bars = make_sideways(10)
-    # Similar to hikkake but stricter
-    bars.append(Bar(open=99, high=101, low=99, close=100))
-    bars.append(Bar(open=99.5, high=100.5, low=99.2, close=99.8))
-    bars.append(Bar(open=99.5, high=100.2, low=99.3, close=99.5))
-    bars.append(Bar(open=99.5, high=99.8, low=98, close=98.5))
-    bars.append(Bar(open=98.5, high=102, low=98, close=101.5))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLHIKKAKEMOD(o, h, l, c)
-    return {"pattern": "CDLHIKKAKEMOD", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlhomingpigeon() -> Dict[str, Any]:
-    """CDLHOMINGPIGEON - Homing Pigeon"""
-    bars = make_downtrend(10)
-    # Large black
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    # Smaller black inside
-    bars.append(Bar(open=70, high=71, low=67, close=68))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLHOMINGPIGEON(o, h, l, c)
-    return {"pattern": "CDLHOMINGPIGEON", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlidentical3crows() -> Dict[str, Any]:
-    """CDLIDENTICAL3CROWS - Identical Three Crows"""
-    bars = make_uptrend(10)
-    # Three black candles, each opening at previous close
-    bars.append(Bar(open=128, high=129, low=122, close=123))
-    bars.append(Bar(open=123, high=124, low=117, close=118))
-    bars.append(Bar(open=118, high=119, low=112, close=113))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLIDENTICAL3CROWS(o, h, l, c)
-    return {"pattern": "CDLIDENTICAL3CROWS", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlinneck() -> Dict[str, Any]:
-    """CDLINNECK - In-Neck Pattern"""
-    bars = make_downtrend(10)
-    # Long black
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    # White opens below low, closes at/near previous close (very close)
-    bars.append(Bar(open=64, high=66.3, low=63, close=66.2))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLINNECK(o, h, l, c)
-    return {"pattern": "CDLINNECK", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlinvertedhammer() -> Dict[str, Any]:
-    """CDLINVERTEDHAMMER - Inverted Hammer"""
-    bars = []
-    for i in range(15):
-        base = 100 - i * 3
-        bars.append(Bar(open=base + 2, high=base + 3, low=base - 1, close=base - 0.5))
-    bars.append(Bar(open=54.5, high=61.0, low=54.0, close=54.0))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLINVERTEDHAMMER(o, h, l, c)
-    return {"pattern": "CDLINVERTEDHAMMER", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlkicking() -> Dict[str, Any]:
-    """CDLKICKING - Kicking"""
-    bars = make_sideways(10)
-    # Black marubozu (open=high, close=low)
-    bars.append(Bar(open=110, high=110, low=100, close=100))
-    # Gap up white marubozu (open=low, close=high) - gap > prev high
-    bars.append(Bar(open=112, high=122, low=112, close=122))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLKICKING(o, h, l, c)
-    return {"pattern": "CDLKICKING", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlkickingbylength() -> Dict[str, Any]:
-    """CDLKICKINGBYLENGTH - Kicking by length"""
-    bars = make_sideways(10)
-    # Black marubozu (shorter)
-    bars.append(Bar(open=110, high=110, low=102, close=102))
-    # Gap up longer white marubozu - longer than first
-    bars.append(Bar(open=112, high=125, low=112, close=125))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLKICKINGBYLENGTH(o, h, l, c)
-    return {"pattern": "CDLKICKINGBYLENGTH", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlladderbottom() -> Dict[str, Any]:
-    """CDLLADDERBOTTOM - Ladder Bottom"""
-    bars = make_downtrend(10)
-    # Three black candles making new lows
-    bars.append(Bar(open=72, high=73, low=68, close=69))
-    bars.append(Bar(open=69, high=70, low=65, close=66))
-    bars.append(Bar(open=66, high=67, low=62, close=63))
-    # Fourth black with long lower shadow
-    bars.append(Bar(open=63, high=64, low=56, close=60))
-    # Fifth white closing above fourth open
-    bars.append(Bar(open=61, high=68, low=60, close=67))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLLADDERBOTTOM(o, h, l, c)
-    return {"pattern": "CDLLADDERBOTTOM", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdllongleggeddoji() -> Dict[str, Any]:
-    """CDLLONGLEGGEDDOJI - Long Legged Doji"""
-    bars = make_sideways(10)
-    # Doji with very long shadows
-    bars.append(Bar(open=100, high=112, low=88, close=100))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLLONGLEGGEDDOJI(o, h, l, c)
-    return {"pattern": "CDLLONGLEGGEDDOJI", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdllongline() -> Dict[str, Any]:
-    """CDLLONGLINE - Long Line Candle"""
-    bars = make_sideways(10)
-    # Very long body candle
-    bars.append(Bar(open=95, high=112, low=94, close=111))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLLONGLINE(o, h, l, c)
-    return {"pattern": "CDLLONGLINE", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlmarubozu() -> Dict[str, Any]:
-    """CDLMARUBOZU - Marubozu"""
-    bars = make_sideways(10)
-    bars.append(Bar(open=100.0, high=110.0, low=100.0, close=110.0))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLMARUBOZU(o, h, l, c)
-    return {"pattern": "CDLMARUBOZU", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlmatchinglow() -> Dict[str, Any]:
-    """CDLMATCHINGLOW - Matching Low"""
-    bars = make_downtrend(10)
-    # Two black candles with same close
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    bars.append(Bar(open=70, high=71, low=65, close=66))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLMATCHINGLOW(o, h, l, c)
-    return {"pattern": "CDLMATCHINGLOW", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlmathold() -> Dict[str, Any]:
-    """CDLMATHOLD - Mat Hold"""
-    bars = make_uptrend(10)
-    # Long white
-    bars.append(Bar(open=128, high=136, low=127, close=135))
-    # Three small declining candles
-    bars.append(Bar(open=134, high=135, low=132, close=133))
-    bars.append(Bar(open=133, high=134, low=131, close=132))
-    bars.append(Bar(open=132, high=133, low=130, close=131))
-    # Long white continuation
-    bars.append(Bar(open=132, high=142, low=131, close=141))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLMATHOLD(o, h, l, c)
-    return {"pattern": "CDLMATHOLD", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlmorningdojistar() -> Dict[str, Any]:
-    """CDLMORNINGDOJISTAR - Morning Doji Star"""
-    bars = make_downtrend(10)
-    # Long black
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    # Gap down doji
-    bars.append(Bar(open=63, high=64, low=62, close=63))
-    # Long white
-    bars.append(Bar(open=64, high=72, low=63, close=71))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLMORNINGDOJISTAR(o, h, l, c)
-    return {"pattern": "CDLMORNINGDOJISTAR", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlmorningstar() -> Dict[str, Any]:
-    """CDLMORNINGSTAR - Morning Star"""
-    bars = make_downtrend(10)
-    bars.append(Bar(open=82.0, high=83.0, low=77.0, close=78.0))
-    bars.append(Bar(open=76.0, high=76.5, low=75.5, close=76.2))
-    bars.append(Bar(open=77.0, high=82.0, low=76.5, close=81.0))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLMORNINGSTAR(o, h, l, c)
-    return {"pattern": "CDLMORNINGSTAR", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlonneck() -> Dict[str, Any]:
-    """CDLONNECK - On-Neck Pattern"""
-    bars = make_downtrend(10)
-    # Long black
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    # Small white closing at previous low
-    bars.append(Bar(open=64, high=66, low=63, close=65))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLONNECK(o, h, l, c)
-    return {"pattern": "CDLONNECK", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlpiercing() -> Dict[str, Any]:
-    """CDLPIERCING - Piercing Pattern"""
-    bars = make_downtrend(10)
-    bars.append(Bar(open=82.0, high=83.0, low=78.0, close=79.0))
-    bars.append(Bar(open=77.0, high=82.0, low=76.0, close=81.0))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLPIERCING(o, h, l, c)
-    return {"pattern": "CDLPIERCING", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlrickshawman() -> Dict[str, Any]:
-    """CDLRICKSHAWMAN - Rickshaw Man"""
-    bars = make_sideways(10)
-    # Long legged doji with body in center
-    bars.append(Bar(open=100, high=115, low=85, close=100))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLRICKSHAWMAN(o, h, l, c)
-    return {"pattern": "CDLRICKSHAWMAN", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlrisefall3methods() -> Dict[str, Any]:
-    """CDLRISEFALL3METHODS - Rising/Falling Three Methods"""
-    bars = make_uptrend(10)
-    # Long white
-    bars.append(Bar(open=128, high=138, low=127, close=137))
-    # Three small declining candles inside first
-    bars.append(Bar(open=136, high=137, low=133, close=134))
-    bars.append(Bar(open=134, high=135, low=131, close=132))
-    bars.append(Bar(open=132, high=133, low=129, close=130))
-    # Long white continuation
-    bars.append(Bar(open=131, high=145, low=130, close=144))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLRISEFALL3METHODS(o, h, l, c)
-    return {"pattern": "CDLRISEFALL3METHODS", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlseparatinglines() -> Dict[str, Any]:
-    """CDLSEPARATINGLINES - Separating Lines"""
-    bars = make_uptrend(10)
-    # Black candle
-    bars.append(Bar(open=128, high=129, low=123, close=124))
-    # White candle opening at same price
-    bars.append(Bar(open=128, high=135, low=127, close=134))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLSEPARATINGLINES(o, h, l, c)
-    return {"pattern": "CDLSEPARATINGLINES", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlshootingstar() -> Dict[str, Any]:
-    """CDLSHOOTINGSTAR - Shooting Star"""
-    bars = []
-    for i in range(15):
-        base = 100 + i * 3
-        bars.append(Bar(open=base - 1, high=base + 2, low=base - 2, close=base + 1))
-    bars.append(Bar(open=147.0, high=154.0, low=146.5, close=146.5))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLSHOOTINGSTAR(o, h, l, c)
-    return {"pattern": "CDLSHOOTINGSTAR", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlshortline() -> Dict[str, Any]:
-    """CDLSHORTLINE - Short Line Candle"""
-    bars = make_sideways(10)
-    # Very short candle
-    bars.append(Bar(open=100, high=101, low=99, close=100.5))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLSHORTLINE(o, h, l, c)
-    return {"pattern": "CDLSHORTLINE", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlspinningtop() -> Dict[str, Any]:
-    """CDLSPINNINGTOP - Spinning Top"""
-    bars = []
-    for i in range(10):
-        base = 100
-        bars.append(Bar(open=base - 2, high=base + 4, low=base - 4, close=base + 2))
-    bars.append(Bar(open=100.0, high=108.0, low=92.0, close=100.5))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLSPINNINGTOP(o, h, l, c)
-    return {"pattern": "CDLSPINNINGTOP", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlstalledpattern() -> Dict[str, Any]:
-    """CDLSTALLEDPATTERN - Stalled Pattern"""
-    bars = make_uptrend(10)
-    # Three white candles with diminishing momentum
-    bars.append(Bar(open=128, high=136, low=127, close=135))
-    bars.append(Bar(open=134, high=140, low=133, close=139))
-    bars.append(Bar(open=139, high=141, low=138, close=140))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLSTALLEDPATTERN(o, h, l, c)
-    return {"pattern": "CDLSTALLEDPATTERN", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlsticksandwich() -> Dict[str, Any]:
-    """CDLSTICKSANDWICH - Stick Sandwich"""
-    bars = make_downtrend(10)
-    # Black candle
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    # White candle
-    bars.append(Bar(open=67, high=73, low=66, close=72))
-    # Black candle closing at same level as first
-    bars.append(Bar(open=71, high=72, low=65, close=66))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLSTICKSANDWICH(o, h, l, c)
-    return {"pattern": "CDLSTICKSANDWICH", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdltakuri() -> Dict[str, Any]:
-    """CDLTAKURI - Takuri (Dragonfly Doji with very long lower shadow)"""
-    bars = make_downtrend(15)
-    # Dragonfly doji with very long lower shadow (open=high=close, huge lower shadow)
-    bars.append(Bar(open=55, high=55, low=35, close=55))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLTAKURI(o, h, l, c)
-    return {"pattern": "CDLTAKURI", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdltasukigap() -> Dict[str, Any]:
-    """CDLTASUKIGAP - Tasuki Gap"""
-    bars = make_uptrend(10)
-    # First white candle
-    bars.append(Bar(open=128, high=134, low=127, close=133))
-    # Gap up second white candle
-    bars.append(Bar(open=135, high=141, low=134, close=140))
-    # Black opens in second body, closes inside gap (between first close and second open)
-    bars.append(Bar(open=139, high=140, low=133.5, close=134))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLTASUKIGAP(o, h, l, c)
-    return {"pattern": "CDLTASUKIGAP", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlthrusting() -> Dict[str, Any]:
-    """CDLTHRUSTING - Thrusting Pattern"""
-    bars = make_downtrend(10)
-    # Long black
-    bars.append(Bar(open=72, high=73, low=65, close=66))
-    # White opening below low, closing below midpoint
-    bars.append(Bar(open=64, high=69, low=63, close=68))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLTHRUSTING(o, h, l, c)
-    return {"pattern": "CDLTHRUSTING", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdltristar() -> Dict[str, Any]:
-    """CDLTRISTAR - Tristar Pattern"""
-    bars = make_downtrend(10)
-    # Three doji with gaps
-    bars.append(Bar(open=70, high=71, low=69, close=70))
-    bars.append(Bar(open=67, high=68, low=66, close=67))
-    bars.append(Bar(open=69, high=70, low=68, close=69))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLTRISTAR(o, h, l, c)
-    return {"pattern": "CDLTRISTAR", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlunique3river() -> Dict[str, Any]:
-    """CDLUNIQUE3RIVER - Unique 3 River"""
-    bars = make_downtrend(10)
-    # Long black
-    bars.append(Bar(open=72, high=73, low=62, close=63))
-    # Harami black with long lower shadow
-    bars.append(Bar(open=65, high=68, low=58, close=64))
-    # Small white closing below second
-    bars.append(Bar(open=62, high=64, low=61, close=63))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLUNIQUE3RIVER(o, h, l, c)
-    return {"pattern": "CDLUNIQUE3RIVER", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlupsidegap2crows() -> Dict[str, Any]:
-    """CDLUPSIDEGAP2CROWS - Upside Gap Two Crows"""
-    bars = make_uptrend(10)
-    # Long white
-    bars.append(Bar(open=128, high=136, low=127, close=135))
-    # Gap up black
-    bars.append(Bar(open=139, high=140, low=136, close=137))
-    # Black engulfing second but above first close
-    bars.append(Bar(open=140, high=141, low=135.5, close=136))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLUPSIDEGAP2CROWS(o, h, l, c)
-    return {"pattern": "CDLUPSIDEGAP2CROWS", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
-
-
-def test_cdlxsidegap3methods() -> Dict[str, Any]:
-    """CDLXSIDEGAP3METHODS - Upside/Downside Gap Three Methods"""
-    bars = make_uptrend(10)
-    # Two white candles with gap
-    bars.append(Bar(open=128, high=134, low=127, close=133))
-    bars.append(Bar(open=136, high=142, low=135, close=141))
-    # Black candle filling the gap
-    bars.append(Bar(open=140, high=141, low=132, close=133))
-
-    o, h, l, c = bars_to_arrays(bars)
-    result = talib.CDLXSIDEGAP3METHODS(o, h, l, c)
-    return {"pattern": "CDLXSIDEGAP3METHODS", "bars": [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars], "result": result.tolist(), "detected_at": [i for i, v in enumerate(result) if v != 0]}
+def run_all(o: np.ndarray, h: np.ndarray, l: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """Run every TA-Lib CDL function on the same bars.
+
+    Returns a (61, N) RESULT_DTYPE matrix whose rows follow TALIB_FUNCS order.
+    Zero-range input only runs ZERO_RANGE_PATTERNS; the other rows are zero.
+    """
+    # TA-Lib copies non-contiguous inputs on every call; do it once up front.
+    o, h, l, c = (np.ascontiguousarray(a, dtype=PRICE_DTYPE) for a in (o, h, l, c))
+    if np.array_equal(o, h) and np.array_equal(h, l) and np.array_equal(l, c):
+        out = np.zeros((len(_FUNC_CALLS), len(c)), dtype=RESULT_DTYPE)
+        for i in _ZERO_RANGE_ROWS:
+            out[i] = _FUNC_CALLS[i](o, h, l, c)
+        return out
+
+    out = np.empty((len(_FUNC_CALLS), len(c)), dtype=RESULT_DTYPE)
+    for i, fn in enumerate(_FUNC_CALLS):
+        out[i] = fn(o, h, l, c)
+    return out
+
+
+def _run_one_fuzz(task: Tuple[str, int, int]) -> np.ndarray:
+    """Evaluate all CDL functions on one (fixture_name, n, seed) task."""
+    name, n, seed = task
+    return run_all(*_fixture(name, n, seed))
+
+
+def _worker_count() -> int:
+    """Pool size for parallel runs: YACPD_WORKERS, defaulting to 1 (in-process).
+
+    Each task is well under a millisecond of TA-Lib work, so starting and
+    feeding a pool costs more than it saves unless the caller opts in.
+    """
+    return int(os.environ.get("YACPD_WORKERS", "1"))
+
+
+def _process_map(fn: Callable[[Any], np.ndarray], items) -> List[np.ndarray]:
+    """Map fn over items across worker processes, preserving order.
+
+    Only runs a pool when YACPD_WORKERS asks for more than one worker; by
+    default (or for a single item) everything runs in-process.
+    """
+    workers = _worker_count()
+    if workers <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_talib_settings) as ex:
+        return list(ex.map(fn, items, chunksize=8))
+
+
+def run_fuzz_tasks(tasks: List[Tuple[str, int, int]]) -> List[np.ndarray]:
+    """Evaluate independent fuzz fixtures across worker processes.
+
+    Returns one run_all matrix per task, in task order.
+    """
+    return _process_map(_run_one_fuzz, tasks)
 
 
 # ============================================================
-# ALL PATTERN TESTS REGISTRY
+# ALL 61 TA-LIB PATTERN TEST CASES
 # ============================================================
 
-ALL_PATTERN_TESTS = [
-    ("CDL2CROWS", test_cdl2crows),
-    ("CDL3BLACKCROWS", test_cdl3blackcrows),
-    ("CDL3INSIDE", test_cdl3inside),
-    ("CDL3LINESTRIKE", test_cdl3linestrike),
-    ("CDL3OUTSIDE", test_cdl3outside),
-    ("CDL3STARSINSOUTH", test_cdl3starsinsouth),
-    ("CDL3WHITESOLDIERS", test_cdl3whitesoldiers),
-    ("CDLABANDONEDBABY", test_cdlabandonedbaby),
-    ("CDLADVANCEBLOCK", test_cdladvanceblock),
-    ("CDLBELTHOLD", test_cdlbelthold),
-    ("CDLBREAKAWAY", test_cdlbreakaway),
-    ("CDLCLOSINGMARUBOZU", test_cdlclosingmarubozu),
-    ("CDLCONCEALBABYSWALL", test_cdlconcealbabyswall),
-    ("CDLCOUNTERATTACK", test_cdlcounterattack),
-    ("CDLDARKCLOUDCOVER", test_cdldarkcloudcover),
-    ("CDLDOJI", test_cdldoji),
-    ("CDLDOJISTAR", test_cdldojistar),
-    ("CDLDRAGONFLYDOJI", test_cdldragonflydoji),
-    ("CDLENGULFING", test_cdlengulfing),
-    ("CDLEVENINGDOJISTAR", test_cdleveningdojistar),
-    ("CDLEVENINGSTAR", test_cdleveningstar),
-    ("CDLGAPSIDESIDEWHITE", test_cdlgapsidesidewhite),
-    ("CDLGRAVESTONEDOJI", test_cdlgravestonedoji),
-    ("CDLHAMMER", test_cdlhammer),
-    ("CDLHANGINGMAN", test_cdlhangingman),
-    ("CDLHARAMI", test_cdlharami),
-    ("CDLHARAMICROSS", test_cdlharamicross),
-    ("CDLHIGHWAVE", test_cdlhighwave),
-    ("CDLHIKKAKE", test_cdlhikkake),
-    ("CDLHIKKAKEMOD", test_cdlhikkakemod),
-    ("CDLHOMINGPIGEON", test_cdlhomingpigeon),
-    ("CDLIDENTICAL3CROWS", test_cdlidentical3crows),
-    ("CDLINNECK", test_cdlinneck),
-    ("CDLINVERTEDHAMMER", test_cdlinvertedhammer),
-    ("CDLKICKING", test_cdlkicking),
-    ("CDLKICKINGBYLENGTH", test_cdlkickingbylength),
-    ("CDLLADDERBOTTOM", test_cdlladderbottom),
-    ("CDLLONGLEGGEDDOJI", test_cdllongleggeddoji),
-    ("CDLLONGLINE", test_cdllongline),
-    ("CDLMARUBOZU", test_cdlmarubozu),
-    ("CDLMATCHINGLOW", test_cdlmatchinglow),
-    ("CDLMATHOLD", test_cdlmathold),
-    ("CDLMORNINGDOJISTAR", test_cdlmorningdojistar),
-    ("CDLMORNINGSTAR", test_cdlmorningstar),
-    ("CDLONNECK", test_cdlonneck),
-    ("CDLPIERCING", test_cdlpiercing),
-    ("CDLRICKSHAWMAN", test_cdlrickshawman),
-    ("CDLRISEFALL3METHODS", test_cdlrisefall3methods),
-    ("CDLSEPARATINGLINES", test_cdlseparatinglines),
-    ("CDLSHOOTINGSTAR", test_cdlshootingstar),
-    ("CDLSHORTLINE", test_cdlshortline),
-    ("CDLSPINNINGTOP", test_cdlspinningtop),
-    ("CDLSTALLEDPATTERN", test_cdlstalledpattern),
-    ("CDLSTICKSANDWICH", test_cdlsticksandwich),
-    ("CDLTAKURI", test_cdltakuri),
-    ("CDLTASUKIGAP", test_cdltasukigap),
-    ("CDLTHRUSTING", test_cdlthrusting),
-    ("CDLTRISTAR", test_cdltristar),
-    ("CDLUNIQUE3RIVER", test_cdlunique3river),
-    ("CDLUPSIDEGAP2CROWS", test_cdlupsidegap2crows),
-    ("CDLXSIDEGAP3METHODS", test_cdlxsidegap3methods),
+@dataclass(frozen=True, eq=False)
+class TestCase:
+    """A curated positive test: a trend prefix followed by the candles that form the pattern."""
+    pattern: str
+    prefix: np.ndarray
+    tail: Tuple[Tuple[float, float, float, float], ...]
+
+    @property
+    def size(self) -> int:
+        """Number of bars in the built series."""
+        return self.prefix.shape[1] + len(self.tail)
+
+    def build(self, bars: Optional[np.ndarray] = None) -> np.ndarray:
+        """Lay the prefix and the pattern candles out in one (4, n) buffer.
+
+        Writes into ``bars`` when given (it must be (4, self.size)), else allocates.
+        """
+        if bars is None:
+            bars = bars_array(self.size)
+        n = self.prefix.shape[1]
+        bars[:, :n] = self.prefix
+        bars[:, n:] = np.transpose(self.tail)
+        return bars
+
+    def run(self, include_bars: bool = True) -> Dict[str, Any]:
+        """Build the series and run the pattern's TA-Lib function over it.
+
+        The "bars" JSON is only assembled when ``include_bars`` is set; callers
+        that just report detections skip it. "result" is left as the raw
+        TA-Lib array; run_pattern_cases() derives "detected_at" for the whole
+        suite at once and the JSON writers serialize the array as-is. The
+        series is built in the shared scratch buffer and only leaves it as a
+        copy, so the buffer is free again once this returns.
+        """
+        bars = self.build(_scratch_bars(self.size))
+        o, h, l, c = bars
+        assert _talib_ready(o, h, l, c), f"{self.pattern} series would be copied by TA-Lib"
+        result = TALIB_FUNCS[self.pattern](o, h, l, c)
+        out = {"pattern": self.pattern, "result": result}
+        if include_bars:
+            out["bars"] = _bars_json(*bars.copy())
+        return out
+
+
+ALL_PATTERN_TESTS: List[TestCase] = [
+    # CDL2CROWS - Two Crows
+    TestCase("CDL2CROWS", UP10, (
+        # Long white candle
+        (128, 135, 127, 134),
+        # First crow: gaps up, closes lower but above first body
+        (136, 137, 132, 133),
+        # Second crow: opens inside first crow, closes inside first white body
+        (134, 135, 129, 130),
+    )),
+    # CDL3BLACKCROWS - Three Black Crows
+    TestCase("CDL3BLACKCROWS", FLAT10_RISE5, (
+        (135.0, 137.0, 125.0, 125.0),
+        (127.0, 128.0, 115.0, 115.0),
+        (118.0, 119.0, 105.0, 105.0),
+    )),
+    # CDL3INSIDE - Three Inside Up/Down
+    TestCase("CDL3INSIDE", DOWN10, (
+        # Large bearish
+        (72, 73, 66, 67),
+        # Small bullish inside
+        (68, 70, 67.5, 69.5),
+        # Bullish confirmation closing above first
+        (69, 74, 68.5, 73),
+    )),
+    # CDL3LINESTRIKE - Three-Line Strike
+    TestCase("CDL3LINESTRIKE", DOWN10, (
+        # Three bearish candles
+        (72, 73, 68, 69),
+        (69, 70, 65, 66),
+        (66, 67, 62, 63),
+        # Bullish engulfing all three
+        (62, 74, 61, 73),
+    )),
+    # CDL3OUTSIDE - Three Outside Up/Down
+    TestCase("CDL3OUTSIDE", DOWN10, (
+        # Small bearish
+        (72, 73, 70, 71),
+        # Bullish engulfing
+        (70, 75, 69, 74),
+        # Bullish confirmation
+        (74, 78, 73, 77),
+    )),
+    # CDL3STARSINSOUTH - Three Stars In The South
+    TestCase("CDL3STARSINSOUTH", DOWN10, (
+        # First: long black with long lower shadow
+        (72, 73, 62, 65),
+        # Second: smaller black, higher low, inside first
+        (66, 67, 63, 64),
+        # Third: small marubozu near lows
+        (64, 65, 63.5, 64.5),
+    )),
+    # CDL3WHITESOLDIERS - Three Advancing White Soldiers
+    TestCase("CDL3WHITESOLDIERS", DOWN10, (
+        (70.0, 75.0, 69.5, 74.8),
+        (73.0, 79.0, 72.5, 78.8),
+        (77.0, 83.0, 76.5, 82.8),
+    )),
+    # CDLABANDONEDBABY - Abandoned Baby
+    TestCase("CDLABANDONEDBABY", DOWN10, (
+        # Long bearish
+        (72, 73, 65, 66),
+        # Doji with gap down (abandoned)
+        (63, 63.5, 62.5, 63),
+        # Long bullish with gap up
+        (65, 72, 64, 71),
+    )),
+    # CDLADVANCEBLOCK - Advance Block
+    TestCase("CDLADVANCEBLOCK", DOWN10, (
+        # Three white candles with diminishing bodies and increasing upper shadows
+        (70, 78, 69, 77),
+        (76, 82, 75, 80),
+        (79, 84, 78, 81),
+    )),
+    # CDLBELTHOLD - Belt-hold
+    TestCase("CDLBELTHOLD", DOWN15, (
+        # Bullish belt hold: opens at low, closes near high
+        (55, 62, 55, 61.5),
+    )),
+    # CDLBREAKAWAY - Breakaway
+    TestCase("CDLBREAKAWAY", DOWN10, (
+        # Long black
+        (72, 73, 65, 66),
+        # Gap down black
+        (64, 65, 62, 63),
+        # Small black
+        (63, 64, 61, 62),
+        # Small black
+        (62, 63, 60, 61),
+        # Long white closing the gap
+        (60, 70, 59, 69),
+    )),
+    # CDLCLOSINGMARUBOZU - Closing Marubozu
+    TestCase("CDLCLOSINGMARUBOZU", SIDE10, (
+        # Bullish closing marubozu: close = high
+        (98, 108, 97, 108),
+    )),
+    # CDLCONCEALBABYSWALL - Concealing Baby Swallow
+    TestCase("CDLCONCEALBABYSWALL", DOWN10, (
+        # Two black marubozu
+        (72, 72, 65, 65),
+        (65, 65, 58, 58),
+        # Black with upper shadow into previous body
+        (56, 60, 52, 53),
+        # Black engulfing third
+        (54, 57, 50, 51),
+    )),
+    # CDLCOUNTERATTACK - Counterattack
+    TestCase("CDLCOUNTERATTACK", DOWN10, (
+        # Long black
+        (72, 73, 65, 66),
+        # Long white closing at same level
+        (60, 67, 59, 66),
+    )),
+    # CDLDARKCLOUDCOVER - Dark Cloud Cover
+    TestCase("CDLDARKCLOUDCOVER", UP10, (
+        (118.0, 122.0, 117.0, 121.0),
+        (123.0, 124.0, 118.0, 119.0),
+    )),
+    # CDLDOJI - Doji
+    TestCase("CDLDOJI", DOWN10, (
+        (80.0, 85.0, 75.0, 80.0),
+    )),
+    # CDLDOJISTAR - Doji Star
+    TestCase("CDLDOJISTAR", DOWN10, (
+        # Long black
+        (72, 73, 65, 66),
+        # Gap down doji
+        (63, 64, 62, 63),
+    )),
+    # CDLDRAGONFLYDOJI - Dragonfly Doji
+    TestCase("CDLDRAGONFLYDOJI", DOWN10, (
+        (80.0, 80.0, 70.0, 80.0),
+    )),
+    # CDLENGULFING - Engulfing Pattern
+    TestCase("CDLENGULFING", DOWN10, (
+        (80.0, 81.0, 79.0, 79.5),
+        (79.0, 82.0, 78.0, 81.5),
+    )),
+    # CDLEVENINGDOJISTAR - Evening Doji Star
+    TestCase("CDLEVENINGDOJISTAR", UP10, (
+        # Long white
+        (128, 135, 127, 134),
+        # Gap up doji
+        (137, 138, 136, 137),
+        # Long black
+        (135, 136, 128, 129),
+    )),
+    # CDLEVENINGSTAR - Evening Star
+    TestCase("CDLEVENINGSTAR", UP10, (
+        (118.0, 123.0, 117.0, 122.0),
+        (124.0, 124.5, 123.5, 123.8),
+        (123.0, 123.5, 118.0, 119.0),
+    )),
+    # CDLGAPSIDESIDEWHITE - Up/Down-gap side-by-side white lines
+    TestCase("CDLGAPSIDESIDEWHITE", UP10, (
+        # Gap up
+        (132, 136, 131, 135),
+        # Two similar white candles side by side
+        (137, 141, 136, 140),
+        (137, 141, 136, 140),
+    )),
+    # CDLGRAVESTONEDOJI - Gravestone Doji
+    TestCase("CDLGRAVESTONEDOJI", UP10, (
+        (120.0, 130.0, 120.0, 120.0),
+    )),
+    # CDLHAMMER - Hammer
+    TestCase("CDLHAMMER", DOWN15, (
+        (54.0, 54.5, 48.0, 54.5),
+    )),
+    # CDLHANGINGMAN - Hanging Man
+    TestCase("CDLHANGINGMAN", UP15, (
+        (145.0, 145.5, 139.0, 145.5),
+    )),
+    # CDLHARAMI - Harami Pattern
+    TestCase("CDLHARAMI", DOWN10, (
+        (82.0, 83.0, 78.0, 79.0),
+        (79.5, 80.5, 79.0, 80.0),
+    )),
+    # CDLHARAMICROSS - Harami Cross Pattern
+    TestCase("CDLHARAMICROSS", DOWN10, (
+        # Large bearish
+        (72, 73, 65, 66),
+        # Doji inside
+        (69, 70, 68, 69),
+    )),
+    # CDLHIGHWAVE - High-Wave Candle
+    TestCase("CDLHIGHWAVE", SIDE10, (
+        # Very long shadows, tiny body
+        (100, 115, 85, 100.5),
+    )),
+    # CDLHIKKAKE - Hikkake Pattern
+    TestCase("CDLHIKKAKE", SIDE10, (
+        # Inside bar
+        (99, 101, 99, 100),
+        (99.5, 100.5, 99.2, 99.8),
+        # Breakout fails
+        (99.5, 99.8, 98, 98.5),
+        # Reversal
+        (98.5, 102, 98, 101.5),
+        (101, 103, 100.5, 102.5),
+    )),
+    # CDLHIKKAKEMOD - Modified Hikkake Pattern
+    TestCase("CDLHIKKAKEMOD", SIDE10, (
+        # Similar to hikkake but stricter
+        (99, 101, 99, 100),
+        (99.5, 100.5, 99.2, 99.8),
+        (99.5, 100.2, 99.3, 99.5),
+        (99.5, 99.8, 98, 98.5),
+        (98.5, 102, 98, 101.5),
+    )),
+    # CDLHOMINGPIGEON - Homing Pigeon
+    TestCase("CDLHOMINGPIGEON", DOWN10, (
+        # Large black
+        (72, 73, 65, 66),
+        # Smaller black inside
+        (70, 71, 67, 68),
+    )),
+    # CDLIDENTICAL3CROWS - Identical Three Crows
+    TestCase("CDLIDENTICAL3CROWS", UP10, (
+        # Three black candles, each opening at previous close
+        (128, 129, 122, 123),
+        (123, 124, 117, 118),
+        (118, 119, 112, 113),
+    )),
+    # CDLINNECK - In-Neck Pattern
+    TestCase("CDLINNECK", DOWN10, (
+        # Long black
+        (72, 73, 65, 66),
+        # White opens below low, closes at/near previous close (very close)
+        (64, 66.3, 63, 66.2),
+    )),
+    # CDLINVERTEDHAMMER - Inverted Hammer
+    TestCase("CDLINVERTEDHAMMER", DOWN15, (
+        (54.5, 61.0, 54.0, 54.0),
+    )),
+    # CDLKICKING - Kicking
+    TestCase("CDLKICKING", SIDE10, (
+        # Black marubozu (open=high, close=low)
+        (110, 110, 100, 100),
+        # Gap up white marubozu (open=low, close=high) - gap > prev high
+        (112, 122, 112, 122),
+    )),
+    # CDLKICKINGBYLENGTH - Kicking by length
+    TestCase("CDLKICKINGBYLENGTH", SIDE10, (
+        # Black marubozu (shorter)
+        (110, 110, 102, 102),
+        # Gap up longer white marubozu - longer than first
+        (112, 125, 112, 125),
+    )),
+    # CDLLADDERBOTTOM - Ladder Bottom
+    TestCase("CDLLADDERBOTTOM", DOWN10, (
+        # Three black candles making new lows
+        (72, 73, 68, 69),
+        (69, 70, 65, 66),
+        (66, 67, 62, 63),
+        # Fourth black with long lower shadow
+        (63, 64, 56, 60),
+        # Fifth white closing above fourth open
+        (61, 68, 60, 67),
+    )),
+    # CDLLONGLEGGEDDOJI - Long Legged Doji
+    TestCase("CDLLONGLEGGEDDOJI", SIDE10, (
+        # Doji with very long shadows
+        (100, 112, 88, 100),
+    )),
+    # CDLLONGLINE - Long Line Candle
+    TestCase("CDLLONGLINE", SIDE10, (
+        # Very long body candle
+        (95, 112, 94, 111),
+    )),
+    # CDLMARUBOZU - Marubozu
+    TestCase("CDLMARUBOZU", SIDE10, (
+        (100.0, 110.0, 100.0, 110.0),
+    )),
+    # CDLMATCHINGLOW - Matching Low
+    TestCase("CDLMATCHINGLOW", DOWN10, (
+        # Two black candles with same close
+        (72, 73, 65, 66),
+        (70, 71, 65, 66),
+    )),
+    # CDLMATHOLD - Mat Hold
+    TestCase("CDLMATHOLD", UP10, (
+        # Long white
+        (128, 136, 127, 135),
+        # Three small declining candles
+        (134, 135, 132, 133),
+        (133, 134, 131, 132),
+        (132, 133, 130, 131),
+        # Long white continuation
+        (132, 142, 131, 141),
+    )),
+    # CDLMORNINGDOJISTAR - Morning Doji Star
+    TestCase("CDLMORNINGDOJISTAR", DOWN10, (
+        # Long black
+        (72, 73, 65, 66),
+        # Gap down doji
+        (63, 64, 62, 63),
+        # Long white
+        (64, 72, 63, 71),
+    )),
+    # CDLMORNINGSTAR - Morning Star
+    TestCase("CDLMORNINGSTAR", DOWN10, (
+        (82.0, 83.0, 77.0, 78.0),
+        (76.0, 76.5, 75.5, 76.2),
+        (77.0, 82.0, 76.5, 81.0),
+    )),
+    # CDLONNECK - On-Neck Pattern
+    TestCase("CDLONNECK", DOWN10, (
+        # Long black
+        (72, 73, 65, 66),
+        # Small white closing at previous low
+        (64, 66, 63, 65),
+    )),
+    # CDLPIERCING - Piercing Pattern
+    TestCase("CDLPIERCING", DOWN10, (
+        (82.0, 83.0, 78.0, 79.0),
+        (77.0, 82.0, 76.0, 81.0),
+    )),
+    # CDLRICKSHAWMAN - Rickshaw Man
+    TestCase("CDLRICKSHAWMAN", SIDE10, (
+        # Long legged doji with body in center
+        (100, 115, 85, 100),
+    )),
+    # CDLRISEFALL3METHODS - Rising/Falling Three Methods
+    TestCase("CDLRISEFALL3METHODS", UP10, (
+        # Long white
+        (128, 138, 127, 137),
+        # Three small declining candles inside first
+        (136, 137, 133, 134),
+        (134, 135, 131, 132),
+        (132, 133, 129, 130),
+        # Long white continuation
+        (131, 145, 130, 144),
+    )),
+    # CDLSEPARATINGLINES - Separating Lines
+    TestCase("CDLSEPARATINGLINES", UP10, (
+        # Black candle
+        (128, 129, 123, 124),
+        # White candle opening at same price
+        (128, 135, 127, 134),
+    )),
+    # CDLSHOOTINGSTAR - Shooting Star
+    TestCase("CDLSHOOTINGSTAR", UP15, (
+        (147.0, 154.0, 146.5, 146.5),
+    )),
+    # CDLSHORTLINE - Short Line Candle
+    TestCase("CDLSHORTLINE", SIDE10, (
+        # Very short candle
+        (100, 101, 99, 100.5),
+    )),
+    # CDLSPINNINGTOP - Spinning Top
+    TestCase("CDLSPINNINGTOP", SIDE10, (
+        (100.0, 108.0, 92.0, 100.5),
+    )),
+    # CDLSTALLEDPATTERN - Stalled Pattern
+    TestCase("CDLSTALLEDPATTERN", UP10, (
+        # Three white candles with diminishing momentum
+        (128, 136, 127, 135),
+        (134, 140, 133, 139),
+        (139, 141, 138, 140),
+    )),
+    # CDLSTICKSANDWICH - Stick Sandwich
+    TestCase("CDLSTICKSANDWICH", DOWN10, (
+        # Black candle
+        (72, 73, 65, 66),
+        # White candle
+        (67, 73, 66, 72),
+        # Black candle closing at same level as first
+        (71, 72, 65, 66),
+    )),
+    # CDLTAKURI - Takuri (Dragonfly Doji with very long lower shadow)
+    TestCase("CDLTAKURI", DOWN15, (
+        # Dragonfly doji with very long lower shadow (open=high=close, huge lower shadow)
+        (55, 55, 35, 55),
+    )),
+    # CDLTASUKIGAP - Tasuki Gap
+    TestCase("CDLTASUKIGAP", UP10, (
+        # First white candle
+        (128, 134, 127, 133),
+        # Gap up second white candle
+        (135, 141, 134, 140),
+        # Black opens in second body, closes inside gap (between first close and second open)
+        (139, 140, 133.5, 134),
+    )),
+    # CDLTHRUSTING - Thrusting Pattern
+    TestCase("CDLTHRUSTING", DOWN10, (
+        # Long black
+        (72, 73, 65, 66),
+        # White opening below low, closing below midpoint
+        (64, 69, 63, 68),
+    )),
+    # CDLTRISTAR - Tristar Pattern
+    TestCase("CDLTRISTAR", DOWN10, (
+        # Three doji with gaps
+        (70, 71, 69, 70),
+        (67, 68, 66, 67),
+        (69, 70, 68, 69),
+    )),
+    # CDLUNIQUE3RIVER - Unique 3 River
+    TestCase("CDLUNIQUE3RIVER", DOWN10, (
+        # Long black
+        (72, 73, 62, 63),
+        # Harami black with long lower shadow
+        (65, 68, 58, 64),
+        # Small white closing below second
+        (62, 64, 61, 63),
+    )),
+    # CDLUPSIDEGAP2CROWS - Upside Gap Two Crows
+    TestCase("CDLUPSIDEGAP2CROWS", UP10, (
+        # Long white
+        (128, 136, 127, 135),
+        # Gap up black
+        (139, 140, 136, 137),
+        # Black engulfing second but above first close
+        (140, 141, 135.5, 136),
+    )),
+    # CDLXSIDEGAP3METHODS - Upside/Downside Gap Three Methods
+    TestCase("CDLXSIDEGAP3METHODS", UP10, (
+        # Two white candles with gap
+        (128, 134, 127, 133),
+        (136, 142, 135, 141),
+        # Black candle filling the gap
+        (140, 141, 132, 133),
+    )),
 ]
 
 
+def _run_case(case: TestCase, include_bars: bool = True) -> Any:
+    """Run one curated case, returning its exception instead of raising it."""
+    try:
+        return case.run(include_bars)
+    except Exception as e:
+        return e
+
+
+def _detections(results: List[np.ndarray]) -> List[List[int]]:
+    """Nonzero positions of each result, found with one scan of a padded (cases, bars) mask."""
+    mask = np.zeros((len(results), max(map(len, results), default=0)), dtype=bool)
+    for row, result in zip(mask, results):
+        np.not_equal(result, 0, out=row[:len(result)])
+    rows, cols = np.nonzero(mask)
+    bounds = np.searchsorted(rows, np.arange(1, len(results)))
+    return [part.tolist() for part in np.split(cols, bounds)]
+
+
+def run_pattern_cases(detections_only: bool = False) -> List[Any]:
+    """Run every curated case in-process.
+
+    Returns each case's result dict (or the exception it raised) in registry
+    order. Each case is one TA-Lib call on a few dozen bars, so a pool's
+    per-task overhead would outweigh the work. With ``detections_only`` each
+    dict holds just "pattern" and "detected_at": neither the bars JSON nor
+    the full result array is kept.
+    """
+    include_bars = not detections_only
+    outcomes = [_run_case(case, include_bars) for case in ALL_PATTERN_TESTS]
+
+    done = [out for out in outcomes if not isinstance(out, Exception)]
+    for out, detected in zip(done, _detections([out["result"] for out in done])):
+        if detections_only:
+            del out["result"]
+        out["detected_at"] = detected
+    return outcomes
+
+
 # ============================================================
 # NEGATIVE TESTS (False Positive Checks)
 # ============================================================
 
+# Patterns checked for false positives on flat data
+_NEGATIVE_PATTERNS: Tuple[Tuple[str, Callable[..., np.ndarray]], ...] = tuple(
+    (name, TALIB_FUNCS[name]) for name in (
+        "CDLDOJI",
+        "CDLENGULFING",
+        "CDLHAMMER",
+        "CDLMORNINGSTAR",
+        "CDL3WHITESOLDIERS",
+        "CDL3BLACKCROWS",
+        "CDLMARUBOZU",
+    )
+)
+
+
 def run_negative_tests() -> Dict[str, Any]:
     """Run negative tests - patterns should NOT be detected on random/neutral data."""
     print("\n" + "=" * 60)
@@ -1123,42 +980,31 @@ def run_negative_tests() -> Dict[str, Any]:
 
     results = {"passed": 0, "failed": 0, "details": []}
 
-    # Generate neutral/random data where patterns shouldn't appear
-    random.seed(42)  # Reproducible
-
+    # Generate neutral data where patterns shouldn't appear
     # Flat sideways data with minimal movement
-    flat_bars = []
-    for _ in range(100):
-        flat_bars.append(Bar(open=100, high=100.5, low=99.5, close=100.1))
+    flat_bars = bars_array(100)
+    flat_bars[:] = [[100], [100.5], [99.5], [100.1]]
 
-    o, h, l, c = bars_to_arrays(flat_bars)
+    o, h, l, c = flat_bars
 
     # Test each pattern on flat data
-    talib_funcs = {
-        "CDLDOJI": talib.CDLDOJI,
-        "CDLENGULFING": talib.CDLENGULFING,
-        "CDLHAMMER": talib.CDLHAMMER,
-        "CDLMORNINGSTAR": talib.CDLMORNINGSTAR,
-        "CDL3WHITESOLDIERS": talib.CDL3WHITESOLDIERS,
-        "CDL3BLACKCROWS": talib.CDL3BLACKCROWS,
-        "CDLMARUBOZU": talib.CDLMARUBOZU,
-    }
-
-    for name, func in talib_funcs.items():
+    for name, func in _NEGATIVE_PATTERNS:
         result = func(o, h, l, c)
-        detections = [i for i, v in enumerate(result) if v != 0]
+        # Positions are only gathered when there is something to report
+        any_hit = bool(np.any(result))
+        detections = np.flatnonzero(result).tolist() if any_hit else []
 
         # Expect no detections on flat data (except possibly doji which IS flat)
         if name == "CDLDOJI":
             # Doji should detect on flat data (that's correct behavior)
-            if len(detections) > 0:
+            if any_hit:
                 print(f"[PASS] {name}: Correctly detects on flat data ({len(detections)} times)")
                 results["passed"] += 1
             else:
                 print(f"[WARN] {name}: Didn't detect doji on flat data")
                 results["passed"] += 1
         else:
-            if len(detections) == 0:
+            if not any_hit:
                 print(f"[PASS] {name}: No false positives on flat data")
                 results["passed"] += 1
             else:
@@ -1178,6 +1024,19 @@ def run_negative_tests() -> Dict[str, Any]:
 # FUZZ TESTING
 # ============================================================
 
+# Key patterns for fuzz testing
+_FUZZ_PATTERNS: Tuple[Tuple[str, Callable[..., np.ndarray]], ...] = tuple(
+    (name, TALIB_FUNCS[name]) for name in (
+        "CDLDOJI",
+        "CDLENGULFING",
+        "CDLHAMMER",
+        "CDLMARUBOZU",
+        "CDLMORNINGSTAR",
+        "CDL3WHITESOLDIERS",
+    )
+)
+
+
 def run_fuzz_tests(iterations: int = 100) -> Dict[str, Any]:
     """Run fuzz tests - compare Rust vs TA-Lib on random data."""
     print("\n" + "=" * 60)
@@ -1186,31 +1045,19 @@ def run_fuzz_tests(iterations: int = 100) -> Dict[str, Any]:
 
     results = {"iterations": iterations, "patterns_tested": 0, "total_detections": 0}
 
-    # Select key patterns for fuzz testing
-    fuzz_patterns = [
-        ("CDLDOJI", talib.CDLDOJI),
-        ("CDLENGULFING", talib.CDLENGULFING),
-        ("CDLHAMMER", talib.CDLHAMMER),
-        ("CDLMARUBOZU", talib.CDLMARUBOZU),
-        ("CDLMORNINGSTAR", talib.CDLMORNINGSTAR),
-        ("CDL3WHITESOLDIERS", talib.CDL3WHITESOLDIERS),
-    ]
-
-    detection_counts = {name: 0 for name, _ in fuzz_patterns}
+    detection_counts = {name: 0 for name, _ in _FUZZ_PATTERNS}
 
     for i in range(iterations):
         # Generate random data
-        random.seed(i)
-        bars = make_random_bars(50, 100, 5)
-        o, h, l, c = bars_to_arrays(bars)
+        o, h, l, c = _fixture("random", 50, i)
 
-        for name, func in fuzz_patterns:
+        for name, func in _FUZZ_PATTERNS:
             result = func(o, h, l, c)
-            detections = sum(1 for v in result if v != 0)
+            detections = int(np.count_nonzero(result))
             detection_counts[name] += detections
             results["total_detections"] += detections
 
-    results["patterns_tested"] = len(fuzz_patterns)
+    results["patterns_tested"] = len(_FUZZ_PATTERNS)
 
     print(f"\nDetection rates over {iterations} random datasets (50 bars each):")
     for name, count in detection_counts.items():
@@ -1226,6 +1073,59 @@ def run_fuzz_tests(iterations: int = 100) -> Dict[str, Any]:
 # REAL MARKET DATA TESTS
 # ============================================================
 
+def _col(df: pd.DataFrame, name: str) -> np.ndarray:
+    """One price column as a contiguous PRICE_DTYPE vector, copying only if it must."""
+    return np.ascontiguousarray(df[name].to_numpy(dtype=PRICE_DTYPE, copy=False).ravel())
+
+
+def _ohlc(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """The (o, h, l, c) vectors of a yfinance price frame.
+
+    Newer yfinance returns (field, ticker) MultiIndex columns even for one
+    ticker; those are looked up by tuple rather than rewriting df.columns.
+    """
+    if isinstance(df.columns, pd.MultiIndex):
+        ticker = df.columns[0][1]
+        return tuple(_col(df, (name, ticker)) for name in ("Open", "High", "Low", "Close"))
+    return tuple(_col(df, name) for name in ("Open", "High", "Low", "Close"))
+
+
+@lru_cache(maxsize=None)
+def _load_real_ohlc(ticker: str, period: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Download a ticker once per process and return its read-only (o, h, l, c).
+
+    Bars with a missing (non-finite) price are dropped: JSON has no NaN, and
+    the exporters must not hand the Rust side nulls. Raises ImportError when
+    yfinance is missing; failures are not cached.
+    """
+    import yfinance as yf
+
+    arrays = _ohlc(yf.download(ticker, period=period, progress=False))
+    finite = np.logical_and.reduce([np.isfinite(arr) for arr in arrays])
+    if not finite.all():
+        arrays = tuple(arr[finite] for arr in arrays)
+    for arr in arrays:
+        arr.setflags(write=False)
+    return arrays
+
+
+# Key patterns summarized on real data
+_REAL_KEY_PATTERNS: Tuple[Tuple[str, Callable[..., np.ndarray]], ...] = tuple(
+    (name, TALIB_FUNCS[name]) for name in (
+        "CDLDOJI",
+        "CDLENGULFING",
+        "CDLHAMMER",
+        "CDLHANGINGMAN",
+        "CDLMORNINGSTAR",
+        "CDLEVENINGSTAR",
+        "CDL3WHITESOLDIERS",
+        "CDL3BLACKCROWS",
+        "CDLMARUBOZU",
+        "CDLSPINNINGTOP",
+    )
+)
+
+
 def run_real_data_tests() -> Dict[str, Any]:
     """Run tests on real market data."""
     print("\n" + "=" * 60)
@@ -1235,48 +1135,24 @@ def run_real_data_tests() -> Dict[str, Any]:
     results = {"status": "skipped", "reason": ""}
 
     try:
-        import yfinance as yf
-
         # Download some real data
         print("Downloading SPY data...")
-        spy = yf.download("SPY", period="6mo", progress=False)
+        o, h, l, c = _load_real_ohlc("SPY", "6mo")
 
-        if len(spy) < 50:
+        if len(c) < 50:
             results["reason"] = "Insufficient data downloaded"
             print(f"[SKIP] {results['reason']}")
             return results
 
-        # Handle MultiIndex columns from yfinance
-        if isinstance(spy.columns, pd.MultiIndex):
-            spy.columns = spy.columns.get_level_values(0)
-
-        o = spy['Open'].values.flatten().astype(np.float64)
-        h = spy['High'].values.flatten().astype(np.float64)
-        l = spy['Low'].values.flatten().astype(np.float64)
-        c = spy['Close'].values.flatten().astype(np.float64)
-
-        print(f"Testing on {len(spy)} bars of SPY data\n")
+        print(f"Testing on {len(c)} bars of SPY data\n")
 
-        # Test all patterns
+        # Test key patterns
         detection_summary = {}
 
-        key_patterns = [
-            ("CDLDOJI", talib.CDLDOJI),
-            ("CDLENGULFING", talib.CDLENGULFING),
-            ("CDLHAMMER", talib.CDLHAMMER),
-            ("CDLHANGINGMAN", talib.CDLHANGINGMAN),
-            ("CDLMORNINGSTAR", talib.CDLMORNINGSTAR),
-            ("CDLEVENINGSTAR", talib.CDLEVENINGSTAR),
-            ("CDL3WHITESOLDIERS", talib.CDL3WHITESOLDIERS),
-            ("CDL3BLACKCROWS", talib.CDL3BLACKCROWS),
-            ("CDLMARUBOZU", talib.CDLMARUBOZU),
-            ("CDLSPINNINGTOP", talib.CDLSPINNINGTOP),
-        ]
-
-        for name, func in key_patterns:
+        for name, func in _REAL_KEY_PATTERNS:
             result = func(o, h, l, c)
-            bullish = sum(1 for v in result if v > 0)
-            bearish = sum(1 for v in result if v < 0)
+            bullish = int(np.count_nonzero(result > 0))
+            bearish = int(np.count_nonzero(result < 0))
             total = bullish + bearish
 
             detection_summary[name] = {"bullish": bullish, "bearish": bearish, "total": total}
@@ -1287,7 +1163,7 @@ def run_real_data_tests() -> Dict[str, Any]:
                 print(f"  {name}: 0 detections")
 
         results["status"] = "success"
-        results["bars_tested"] = len(spy)
+        results["bars_tested"] = len(c)
         results["detections"] = detection_summary
 
     except ImportError:
@@ -1312,23 +1188,23 @@ def run_positive_tests() -> Dict[str, Any]:
 
     results = {"passed": 0, "warned": 0, "failed": 0, "details": []}
 
-    for name, test_func in ALL_PATTERN_TESTS:
-        try:
-            result = test_func()
-            detected = result.get("detected_at", [])
-
-            if detected:
-                print(f"[PASS] {name}: Detected at {detected}")
-                results["passed"] += 1
-            else:
-                print(f"[WARN] {name}: Not detected (strict TA-Lib params)")
-                results["warned"] += 1
+    # Only detections are reported here, so skip the bars and result lists.
+    for case, result in zip(ALL_PATTERN_TESTS, run_pattern_cases(detections_only=True)):
+        name = case.pattern
+        if isinstance(result, Exception):
+            print(f"[FAIL] {name}: {result}")
+            results["failed"] += 1
+            continue
 
-            results["details"].append(result)
+        detected = result.get("detected_at", [])
+        if detected:
+            print(f"[PASS] {name}: Detected at {detected}")
+            results["passed"] += 1
+        else:
+            print(f"[WARN] {name}: Not detected (strict TA-Lib params)")
+            results["warned"] += 1
 
-        except Exception as e:
-            print(f"[FAIL] {name}: {e}")
-            results["failed"] += 1
+        results["details"].append(result)
 
     return results
 
@@ -1373,17 +1249,16 @@ def export_test_cases(output_path: str = "tests/talib_test_cases.json"):
     """Export all test cases to JSON."""
     results = {}
 
-    for name, test_func in ALL_PATTERN_TESTS:
-        try:
-            results[name] = test_func()
-        except Exception as e:
-            results[name] = {"error": str(e)}
+    for case, result in zip(ALL_PATTERN_TESTS, run_pattern_cases()):
+        if isinstance(result, Exception):
+            result = {"error": str(result)}
+        results[case.pattern] = result
 
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
     with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2)
+        json.dump(results, f, indent=2, default=_json_default)
 
     print(f"Test cases exported to: {output_file}")
 
@@ -1393,40 +1268,32 @@ def export_json_to_stdout():
 
     Used by Rust integration tests (talib_crossval.rs) to get TA-Lib reference data.
     """
-    import os
     import sys
 
     fuzz_rounds = int(os.environ.get("YACPD_FUZZ_ROUNDS", "10"))
 
     # Collect all 61 curated test cases
     test_cases = {}
-    for name, test_func in ALL_PATTERN_TESTS:
-        try:
-            result = test_func()
-            test_cases[name] = {
-                "bars": result["bars"],
-                "result": result["result"],
-                "detected_at": result["detected_at"],
-            }
-        except Exception as e:
-            print(f"WARNING: {name} failed: {e}", file=sys.stderr)
+    for case, result in zip(ALL_PATTERN_TESTS, run_pattern_cases()):
+        if isinstance(result, Exception):
+            print(f"WARNING: {case.pattern} failed: {result}", file=sys.stderr)
+            continue
+        test_cases[case.pattern] = {
+            "bars": result["bars"],
+            "result": result["result"],
+            "detected_at": result["detected_at"],
+        }
 
     # Generate fuzz rounds
+    seeds = range(fuzz_rounds)
+    matrices = run_fuzz_tasks([("random", 50, seed) for seed in seeds])
     fuzz = []
-    for seed in range(fuzz_rounds):
-        random.seed(seed)
-        bars = make_random_bars(50, 100, 5)
-        o, h, l, c = bars_to_arrays(bars)
-        bars_json = [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars]
-
-        results = {}
-        for fname, func in TALIB_FUNCS.items():
-            result = func(o, h, l, c)
-            results[fname] = result.tolist()
+    for seed, matrix in zip(seeds, matrices):
+        results = dict(zip(_FUNC_NAMES, matrix))
 
         fuzz.append({
             "seed": seed,
-            "bars": bars_json,
+            "bars": _fixture_json("random", 50, seed),
             "results": results,
         })
 
@@ -1437,7 +1304,7 @@ def export_json_to_stdout():
     }
 
     # Write JSON to stdout (compact for speed)
-    json.dump(output, sys.stdout, separators=(",", ":"))
+    dump_json(output, sys.stdout)
 
 
 def export_enhanced_json_to_stdout():
@@ -1445,59 +1312,46 @@ def export_enhanced_json_to_stdout():
 
     Used by Rust integration tests (talib_crossval.rs) for deeper validation.
     """
-    import os
     import sys
 
     enhanced_fuzz_rounds = int(os.environ.get("YACPD_ENHANCED_FUZZ_ROUNDS", "100"))
 
     # 1. Edge cases — 5 scenarios, run all 61 patterns on each
     edge_cases = {}
-    for name, gen_func in [
-        ("zero_range", make_zero_range_bars),
-        ("gaps", make_gap_bars),
-        ("extreme_high", make_extreme_high_bars),
-        ("extreme_low", make_extreme_low_bars),
-        ("micro_volatility", make_micro_volatility_bars),
-    ]:
-        random.seed(42)  # Deterministic for each edge case
-        bars = gen_func(100)
-        o, h, l, c = bars_to_arrays(bars)
-        bars_json = [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars]
-        results = {fname: func(o, h, l, c).tolist() for fname, func in TALIB_FUNCS.items()}
-        edge_cases[name] = {"bars": bars_json, "results": results}
+    edge_names = ["zero_range", "gaps", "extreme_high", "extreme_low", "micro_volatility"]
+    # Deterministic for each edge case
+    matrices = run_fuzz_tasks([(name, 100, 42) for name in edge_names])
+    for name, matrix in zip(edge_names, matrices):
+        results = dict(zip(_FUNC_NAMES, matrix))
+        edge_cases[name] = {"bars": _fixture_json(name, 100, 42), "results": results}
 
     # 2. Enhanced fuzz — 100 rounds, 500 bars, variable volatility/base
+    # Round i draws volatility, base and bars from its own stream make_rng(1000 + i)
+    # (offset so it does not overlap basic fuzz), so each "seed" can be rebuilt alone.
+    rngs = [make_rng(1000 + i) for i in range(enhanced_fuzz_rounds)]
+    vols = np.array([rng.uniform(0.5, 30.0) for rng in rngs])
+    bases = np.array([rng.uniform(10.0, 5000.0) for rng in rngs])
+    batch = make_random_bars_batch(500, bases, vols, rngs)
+    # Evaluated in-process: shipping each buffer and matrix to a worker costs
+    # about as much as the TA-Lib work on a 500-bar round.
     enhanced_fuzz = []
-    for i in range(enhanced_fuzz_rounds):
-        random.seed(1000 + i)  # Offset seeds to not overlap with basic fuzz
-        volatility = random.uniform(0.5, 30.0)
-        base = random.uniform(10.0, 5000.0)
-        bars = make_random_bars(500, base, volatility)
-        o, h, l, c = bars_to_arrays(bars)
-        bars_json = [{"o": b.open, "h": b.high, "l": b.low, "c": b.close} for b in bars]
-        results = {fname: func(o, h, l, c).tolist() for fname, func in TALIB_FUNCS.items()}
+    for i, (o, h, l, c) in enumerate(batch):
+        bars_json = _bars_json(o, h, l, c)
+        results = dict(zip(_FUNC_NAMES, run_all(o, h, l, c)))
         enhanced_fuzz.append({
             "seed": 1000 + i, "bars_count": 500,
-            "volatility": volatility, "base": base,
+            "volatility": float(vols[i]), "base": float(bases[i]),
             "bars": bars_json, "results": results,
         })
 
     # 3. Real data (optional — skip section if yfinance unavailable)
     real_data = {}
     try:
-        import yfinance as yf
         for ticker in ["SPY", "AMD", "AAPL", "BTC-USD"]:
-            df = yf.download(ticker, period="20y", progress=False)
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = df.columns.get_level_values(0)
-            o = df['Open'].values.flatten().astype(np.float64)
-            h = df['High'].values.flatten().astype(np.float64)
-            l = df['Low'].values.flatten().astype(np.float64)
-            c = df['Close'].values.flatten().astype(np.float64)
-            bars_json = [{"o": float(ov), "h": float(hv), "l": float(lv), "c": float(cv)}
-                         for ov, hv, lv, cv in zip(o, h, l, c)]
-            results = {fname: func(o, h, l, c).tolist() for fname, func in TALIB_FUNCS.items()}
-            real_data[ticker] = {"bars": bars_json, "bar_count": len(bars_json), "results": results}
+            o, h, l, c = _load_real_ohlc(ticker, "20y")
+            bars_json = _bars_json(o, h, l, c)
+            results = dict(zip(_FUNC_NAMES, run_all(o, h, l, c)))
+            real_data[ticker] = {"bars": bars_json, "bar_count": len(c), "results": results}
     except Exception:
         pass  # real_data stays empty — Rust side handles gracefully
 
@@ -1507,7 +1361,7 @@ def export_enhanced_json_to_stdout():
         "enhanced_fuzz": enhanced_fuzz,
         "real_data": real_data,
     }
-    json.dump(output, sys.stdout, separators=(",", ":"))
+    dump_json(output, sys.stdout)
 
 
 if __name__ == "__main__":